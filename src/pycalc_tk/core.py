@@ -20,7 +20,8 @@ python -c "from pycalc_tk.core import CalculatorEngine; print(CalculatorEngine()
 
 Notes:
 - Uses Python's `decimal` for high-precision, banker’s rounding (ROUND_HALF_EVEN).
-- Avoids `eval` by parsing expressions via `ast`.
+- Never `eval`s user text: expressions are parsed and validated via `ast`; simple ones are run
+  as bytecode compiled from the validated tree.
 - Set precision at runtime via `set_precision(digits)` or GUI control.
 """
 
@@ -28,17 +29,29 @@ Notes:
 from __future__ import annotations
 
 import ast
+import functools
+import re
 from dataclasses import dataclass
-from decimal import Decimal, getcontext, Context, localcontext, ROUND_HALF_EVEN
-from typing import Any, Dict, Mapping
+from types import CodeType
+from decimal import (
+    Decimal, getcontext, Context, localcontext, ROUND_HALF_EVEN,
+    DivisionByZero, InvalidOperation, Overflow,
+)
+from typing import Any, Callable, ClassVar, Dict, Final, List, Tuple
+
+try:  # optional: MPFR-backed transcendental functions for high precision
+    import gmpy2  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - depends on the environment
+    gmpy2 = None
 
 # Global context: very high precision by default; adjust via set_precision()
 _DEFAULT_PRECISION = 1000
 getcontext().prec = _DEFAULT_PRECISION
 getcontext().rounding = ROUND_HALF_EVEN
-getcontext().traps[decimal.FloatOperation] = True  # type: ignore[name-defined]
 
-import decimal  # after setting traps we can import for type hints
+# Shared immutable Decimal singletons for the hot paths
+_ZERO: Final = Decimal(0)
+_ONE: Final = Decimal(1)
 
 
 @dataclass
@@ -48,11 +61,58 @@ class EvalSettings:
     max_depth: int = 64  # safety for nested expressions
 
 
-SAFE_CONSTS: Mapping[str, Decimal] = {
-    "pi": Decimal("3.14159265358979323846264338327950288419716939937510"),
-    "e": Decimal("2.71828182845904523536028747135266249775724709369995"),
-    "tau": Decimal("6.28318530717958647692528676655900576839433879875021"),
-}
+# -------- Constants --------
+# pi, e and tau are computed the first time a program reads them at a given precision (see
+# DecimalEvaluator.eval), so changing the precision stays instant. The series run on fixed-point
+# Python ints: every step is a division by a small int, which is linear in the number of digits.
+
+_CONST_GUARD_DIGITS: Final = 10
+_CONSTANTS: Final = frozenset({"pi", "e", "tau"})
+
+def _arctan_inv(x: int, one: int) -> int:
+    """arctan(1/x) * one by its Taylor series, in fixed point."""
+    x2 = x * x
+    power = total = one // x
+    k, sign = 1, 1
+    while power:
+        power //= x2
+        k += 2
+        sign = -sign
+        total += sign * (power // k)
+    return total
+
+def _e_fixed(one: int) -> int:
+    """e * one as the sum of 1/k!, in fixed point."""
+    term, total, k = one, 0, 0
+    while term:
+        total += term
+        k += 1
+        term //= k
+    return total
+
+@functools.lru_cache(maxsize=16)
+def _const_at(name: str, prec: int) -> Decimal:
+    """Constant `name` (pi, e or tau) correctly rounded to `prec` digits."""
+    digits = prec + _CONST_GUARD_DIGITS
+    if gmpy2 is not None and prec >= _HIGH_PREC_THRESHOLD:
+        mctx = gmpy2.context(precision=int(digits * _BITS_PER_DIGIT) + 1)
+        if name == "e":
+            r = mctx.exp(1)
+        else:
+            r = mctx.const_pi()
+            if name == "tau":
+                r = mctx.mul(r, 2)  # in mctx: plain `*` would round to gmpy2's default precision
+        exact = Decimal(format(r, f".{digits}e"))
+    else:
+        one = 10 ** digits
+        if name == "e":
+            n = _e_fixed(one)
+        else:
+            n = 4 * (4 * _arctan_inv(5, one) - _arctan_inv(239, one))  # Machin's formula
+            if name == "tau":
+                n *= 2
+        exact = Decimal(n).scaleb(-digits, Context(prec=digits + 2))  # only moves the exponent
+    return Context(prec=prec).plus(exact)
 
 def set_precision(prec: int) -> None:
     """Set global default precision (affects subsequent evaluations)."""
@@ -61,14 +121,315 @@ def set_precision(prec: int) -> None:
     ctx = getcontext()
     ctx.prec = prec
 
+# -------- High-precision functions --------
+# At high precision decimal's ln/exp/log10/sqrt get slow; when gmpy2 is installed they are
+# computed by MPFR with guard digits and rounded back into the current decimal context. Exact
+# results (sqrt(4), log10(1000), ln(1), exp(0)) are left to decimal, which gives them their
+# ideal exponent ("2", not "2.000...0").
+
+_HIGH_PREC_THRESHOLD: Final = 200
+_GUARD_DIGITS: Final = 10
+_BITS_PER_DIGIT: Final = 3.3219280948873626  # log2(10)
+
+def _via_mpfr(x: Decimal, name: str) -> Decimal | None:
+    """MPFR result of gmpy2 function `name` at x, or None to use the decimal implementation."""
+    ctx = getcontext()
+    if gmpy2 is None or ctx.prec < _HIGH_PREC_THRESHOLD or ctx.rounding != ROUND_HALF_EVEN or not x.is_finite():
+        return None
+    digits = ctx.prec + _GUARD_DIGITS
+    mctx = gmpy2.context(precision=int(digits * _BITS_PER_DIGIT) + 1)
+    r = getattr(mctx, name)(gmpy2.mpfr(str(x), mctx.precision))
+    if not gmpy2.is_finite(r):
+        return None  # domain error or overflow: let decimal signal it as usual
+    return ctx.plus(Decimal(format(r, f".{digits}e")))
+
+def _sqrt(x: Decimal) -> Decimal:
+    r = _via_mpfr(x, "sqrt")
+    if r is None or r.fma(r, x.copy_negate()).is_zero():  # single rounding: zero only if r*r == x
+        return x.sqrt()
+    return r
+
+def _ln(x: Decimal) -> Decimal:
+    r = None if x == _ONE else _via_mpfr(x, "log")
+    return x.ln() if r is None else r
+
+def _log10(x: Decimal) -> Decimal:
+    r = None if x == _ONE.scaleb(x.adjusted()) else _via_mpfr(x, "log10")  # powers of ten
+    return x.log10() if r is None else r
+
+def _exp(x: Decimal) -> Decimal:
+    r = None if x.is_zero() else _via_mpfr(x, "exp")
+    return x.exp() if r is None else r
+
 def _to_decimal(n: Any) -> Decimal:
-    if isinstance(n, Decimal):
+    # Exact type checks: AST constants are plain int/str, and bool must not pass as int
+    t = type(n)
+    if t is Decimal:
         return n
-    if isinstance(n, (int, str)):
-        return Decimal(str(n))
-    raise TypeError(f"Unsupported literal type: {type(n)}")
+    if t is int or t is str:
+        return Decimal(n)  # exact; no str() round-trip needed
+    raise TypeError(f"Unsupported literal type: {t}")
+
+# -------- Compiled expression programs --------
+# Expressions are lowered once into a flat postfix program of (opcode, arg) pairs,
+# which DecimalEvaluator._run executes over a small value stack.
+
+OP_CONST: Final = 0
+OP_VAR: Final = 1
+OP_ADD: Final = 2
+OP_SUB: Final = 3
+OP_MUL: Final = 4
+OP_DIV: Final = 5
+OP_MOD: Final = 6
+OP_POW: Final = 7
+OP_NEG: Final = 8
+OP_CALL1: Final = 9
+OP_CALL2: Final = 10
+
+Instr = Tuple[int, Any]
+Program = Tuple[Instr, ...]
+
+_BINOP_CODES: Final[Dict[type, int]] = {
+    ast.Add: OP_ADD,
+    ast.Sub: OP_SUB,
+    ast.Mult: OP_MUL,
+    ast.Div: OP_DIV,
+    ast.Mod: OP_MOD,
+    ast.Pow: OP_POW,
+}
+
+_UNOP_CODES: Final[Dict[type, int | None]] = {
+    ast.UAdd: None,  # unary plus is a no-op
+    ast.USub: OP_NEG,
+}
+
+# Pending compile work: an AST node to expand, or an instruction to emit once its operands are out
+Work = List[Tuple[Any, int]]
+
+@functools.lru_cache(maxsize=256)
+def _compile_cached(expr: str) -> Tuple[Program, int, Folded | None, Bytecode | None, Tuple[str, ...]]:
+    """Parse, validate and compile an expression once.
+
+    Returns (program, max node depth, folded integer result or None, bytecode or None,
+    constants the program reads).
 
-class DecimalEvaluator(ast.NodeVisitor):
+    Programs are immutable, so they are shared by all evaluators; each evaluator only
+    compares the stored depth against its own max_depth.
+    """
+    tree = ast.parse(expr, mode="eval").body
+    _exact_float_literals(tree, expr)
+    code, depth = _compile(tree)
+    consts = tuple(sorted({arg for op, arg in code if op == OP_VAR and arg in _CONSTANTS}))
+    return code, depth, _fold_int(code), _to_bytecode(code, depth), consts
+
+def _exact_float_literals(tree: ast.AST, source: str) -> None:
+    """Swap float literals for their source text, which _to_decimal converts exactly ("0.1").
+
+    No binary float ever reaches Decimal arithmetic, so the evaluation context does not
+    need a FloatOperation trap.
+    """
+    for node in ast.walk(tree):
+        if type(node) is ast.Constant and type(node.value) is float:
+            text = ast.get_source_segment(source, node)
+            if text is None:
+                raise TypeError(f"Unsupported literal type: {float}")
+            node.value = text
+
+def _compile(root: ast.AST) -> Tuple[Program, int]:
+    # Iterative post-order walk over an explicit work stack: no Python recursion per node.
+    # All validation (syntax, functions, arity, literals) happens here, never at run time.
+    out: List[Instr] = []
+    todo: Work = [(root, 0)]
+    max_depth = 0
+    while todo:
+        item, depth = todo.pop()
+        if type(item) is tuple:
+            out.append(item)
+            continue
+        if depth > max_depth:
+            max_depth = depth
+        try:
+            handler = _COMPILERS[type(item)]
+        except KeyError:
+            raise SyntaxError("Unsupported syntax in expression.") from None
+        handler(item, depth, out, todo)
+    return tuple(out), max_depth
+
+# ---- Node handlers ----
+# Leaves emit directly; inner nodes schedule their instruction, then their operands (last pushed
+# is compiled first), so operands are always emitted before the instruction that consumes them.
+def _c_const(node: ast.Constant, depth: int, out: List[Instr], todo: Work) -> None:
+    out.append((OP_CONST, _to_decimal(node.value)))
+
+def _c_binop(node: ast.BinOp, depth: int, out: List[Instr], todo: Work) -> None:
+    code = _BINOP_CODES.get(type(node.op))
+    if code is None:
+        raise SyntaxError("Unsupported binary operator.")
+    todo.append(((code, None), depth))
+    todo.append((node.right, depth + 1))
+    todo.append((node.left, depth + 1))
+
+def _c_unary(node: ast.UnaryOp, depth: int, out: List[Instr], todo: Work) -> None:
+    try:
+        code = _UNOP_CODES[type(node.op)]
+    except KeyError:
+        raise SyntaxError("Unsupported unary operator.") from None
+    if code is not None:
+        todo.append(((code, None), depth))
+    todo.append((node.operand, depth + 1))
+
+def _c_name(node: ast.Name, depth: int, out: List[Instr], todo: Work) -> None:
+    out.append((OP_VAR, node.id))
+
+def _c_call(node: ast.Call, depth: int, out: List[Instr], todo: Work) -> None:
+    if node.keywords:
+        raise ValueError("Keyword arguments are not supported.")
+    fname = getattr(node.func, "id", None)
+    if fname not in DecimalEvaluator.allowed_funcs:
+        raise NameError(f"Unsupported function: {fname}")
+    # Functions are resolved to their callables here, not looked up per evaluation
+    if len(node.args) == 1:
+        todo.append(((OP_CALL1, DecimalEvaluator.allowed_funcs[fname]), depth))
+    elif len(node.args) == 2:
+        todo.append(((OP_CALL2, DecimalEvaluator.allowed_funcs[fname]), depth))
+    else:
+        raise TypeError(f"Unsupported number of arguments for {fname}().")
+    todo.extend((a, depth + 1) for a in reversed(node.args))
+
+_COMPILERS: Final[Dict[type, Callable[[Any, int, List[Instr], Work], None]]] = {
+    ast.Constant: _c_const,
+    ast.BinOp: _c_binop,
+    ast.UnaryOp: _c_unary,
+    ast.Name: _c_name,
+    ast.Call: _c_call,
+}
+
+# ---- Integer fast path ----
+# Keypad expressions are often integer-only ("1+2*3", "2**10"). Such programs have no variables,
+# so they are folded once with exact Python ints at compile time. Each evaluator returns the
+# folded value whenever every operand and intermediate result has at most `prec` digits: in
+# that range each Decimal operation is exact, so both paths agree digit for digit.
+
+_INT_OPS: Final = frozenset({OP_ADD, OP_SUB, OP_MUL, OP_DIV, OP_MOD, OP_POW, OP_NEG})
+# ~1233 digits, enough for the default precision. Wider values stay on the Decimal path: libmpdec
+# is just as fast there, while converting a huge int to Decimal takes quadratic time.
+_FOLD_MAX_BITS: Final = 1 << 12
+
+Folded = Tuple[Decimal, int]  # (exact result, largest magnitude seen while computing it)
+
+def _fold_int(code: Program) -> Folded | None:
+    """Fold an int-pure program; None if it is not int-pure or Decimal could differ.
+
+    Inexact division, negative exponents, 0**0, division by zero and zero results
+    (which may be a signed Decimal zero) are all left to the Decimal path.
+    """
+    stack: List[int] = []
+    push, pop = stack.append, stack.pop
+    peak = 0
+    for op, arg in code:
+        if op == OP_CONST:
+            if arg.as_tuple().exponent != 0:
+                return None
+            r = int(arg)
+            push(r)
+        elif op not in _INT_OPS:
+            return None
+        elif op == OP_NEG:
+            stack[-1] = -stack[-1]
+            continue
+        else:
+            b = pop()
+            a = stack[-1]
+            if op == OP_ADD:
+                r = a + b
+            elif op == OP_SUB:
+                r = a - b
+            elif op == OP_MUL:
+                r = a * b
+            elif op == OP_DIV:
+                if b == 0 or a % b:
+                    return None
+                r = a // b
+            elif op == OP_MOD:
+                if b == 0:
+                    return None
+                r = abs(a) % abs(b)  # Decimal % takes the sign of the dividend
+                if a < 0:
+                    r = -r
+            else:  # OP_POW
+                if b < 0 or (a == 0 and b == 0):
+                    return None
+                if abs(a) > 1 and (abs(a).bit_length() - 1) * b > _FOLD_MAX_BITS:
+                    return None  # do not build the huge int
+                r = a ** b
+            stack[-1] = r
+        r = abs(r)
+        if r.bit_length() > _FOLD_MAX_BITS:
+            return None
+        if r > peak:
+            peak = r
+    result = stack[-1]
+    return (Decimal(result), peak) if result else None
+
+# ---- Bytecode fast path ----
+# Call-free programs are turned back into an AST and compiled with compile(), so CPython's own
+# eval loop does the dispatch. Literals are bound as globals named "$0", "$1", ...: a name that
+# cannot be written in an expression, so it never collides with a user identifier. Programs that
+# name one of the other globals (__builtins__) stay on _run. Nothing but the validated program
+# reaches compile().
+
+_BYTECODE_MAX_DEPTH: Final = 200  # compile() recurses per node; deeper programs use _run
+
+_AST_BINOPS: Final[Dict[int, Callable[[], ast.operator]]] = {
+    OP_ADD: ast.Add,
+    OP_SUB: ast.Sub,
+    OP_MUL: ast.Mult,
+    OP_POW: ast.Pow,
+}
+
+Bytecode = Tuple[CodeType, Dict[str, Any]]  # (code object, globals holding literals and helpers)
+
+def _div(a: Decimal, b: Decimal) -> Decimal:
+    if b == 0:
+        raise ZeroDivisionError("Division by zero.")
+    return a / b
+
+def _mod(a: Decimal, b: Decimal) -> Decimal:
+    if b == 0:
+        raise ZeroDivisionError("Modulo by zero.")
+    return a % b
+
+def _to_bytecode(code: Program, depth: int) -> Bytecode | None:
+    """Compile a call-free program to a code object; None if it must run on _run."""
+    if depth > _BYTECODE_MAX_DEPTH:
+        return None
+    env: Dict[str, Any] = {"__builtins__": {}, "$div": _div, "$mod": _mod}
+    stack: List[ast.expr] = []
+    for op, arg in code:
+        if op == OP_CONST:
+            name = f"${len(env)}"
+            env[name] = arg
+            stack.append(ast.Name(name, ast.Load()))
+        elif op == OP_VAR:
+            if arg in env:
+                return None  # would resolve to the injected global, not a variable
+            stack.append(ast.Name(arg, ast.Load()))
+        elif op == OP_NEG:
+            stack[-1] = ast.UnaryOp(ast.USub(), stack[-1])
+        elif op in _AST_BINOPS:
+            b = stack.pop()
+            stack[-1] = ast.BinOp(stack[-1], _AST_BINOPS[op](), b)
+        elif op == OP_DIV or op == OP_MOD:
+            # zero checks live in the helpers so errors match _run
+            b = stack.pop()
+            helper = ast.Name("$div" if op == OP_DIV else "$mod", ast.Load())
+            stack[-1] = ast.Call(helper, [stack[-1], b], [])
+        else:
+            return None  # function calls stay on the stack machine
+    tree = ast.fix_missing_locations(ast.Expression(stack[-1]))
+    return compile(tree, "<expr>", "eval"), env
+
+class DecimalEvaluator:
     """
     Safe expression evaluator to Decimal using Python AST.
     Supports: +, -, *, /, %, **, unary +/-, parentheses.
@@ -76,105 +437,116 @@ class DecimalEvaluator(ast.NodeVisitor):
     Constants: pi, e, tau.
     """
 
-    allowed_funcs = {
-        "sqrt": lambda x: x.sqrt(),
-        "ln": lambda x: x.ln(),
-        "log10": lambda x: x.log10(),
-        "exp": lambda x: x.exp(),
+    allowed_funcs: ClassVar[Dict[str, Callable[..., Decimal]]] = {
+        "sqrt": _sqrt,
+        "ln": _ln,
+        "log10": _log10,
+        "exp": _exp,
         "abs": lambda x: x.copy_abs(),
-        "round": lambda x, n=Decimal(0): _round_decimal(x, int(n)),
+        "round": lambda x, n=_ZERO: _round_decimal(x, int(n)),
         "pow": lambda x, y: x.__pow__(y),
     }
 
     def __init__(self, settings: EvalSettings | None = None, variables: Dict[str, Decimal] | None = None):
-        super().__init__()
         self.settings = settings or EvalSettings()
-        self.vars: Dict[str, Decimal] = dict(SAFE_CONSTS)
+        self.vars: Dict[str, Decimal] = {}
+        self._invalidate_ctx()
         if variables:
             # Allow user variables (e.g., memory recall) as Decimals
             self.vars.update({k: _to_decimal(v) for k, v in variables.items()})
 
-    def eval(self, expr: str) -> Decimal:
-        with localcontext(Context(prec=self.settings.precision, rounding=self.settings.rounding)):
-            node = ast.parse(expr, mode="eval")
-            return self._eval_node(node.body, depth=0)
+    def _invalidate_ctx(self) -> None:
+        """Rebuild the cached Context from settings and drop constants computed at the old precision."""
+        self._ctx = Context(
+            prec=self.settings.precision,
+            rounding=self.settings.rounding,
+            traps=[DivisionByZero, InvalidOperation, Overflow],
+        )
+        self._int_limit = 10 ** self.settings.precision
+        for name in _CONSTANTS:
+            self.vars.pop(name, None)  # recomputed lazily at the new precision
 
-    # ---- Node handlers ----
-    def _eval_node(self, node: ast.AST, depth: int) -> Decimal:
+    def eval(self, expr: str) -> Decimal:
+        code, depth, folded, bytecode, consts = _compile_cached(expr)
         if depth > self.settings.max_depth:
             raise ValueError("Expression too deeply nested.")
-        match node:
-            case ast.Constant(value=v):
-                return _to_decimal(v)
-            case ast.Num(n=n):  # py<3.8 compatibility
-                return _to_decimal(n)
-            case ast.BinOp(left=l, op=op, right=r):
-                a, b = self._eval_node(l, depth + 1), self._eval_node(r, depth + 1)
-                return self._apply_binop(a, op, b)
-            case ast.UnaryOp(op=op, operand=operand):
-                val = self._eval_node(operand, depth + 1)
-                return self._apply_unary(op, val)
-            case ast.Name(id=name):
-                if name in self.vars:
-                    return self.vars[name]
-                raise NameError(f"Unknown identifier: {name}")
-            case ast.Call(func=f, args=args, keywords=kwargs):
-                if kwargs:
-                    raise ValueError("Keyword arguments are not supported.")
-                fname = getattr(f, "id", None)
-                if fname not in self.allowed_funcs:
-                    raise NameError(f"Unsupported function: {fname}")
-                dargs = [self._eval_node(a, depth + 1) for a in args]
-                # Special case: pow should enforce integer exponent if exponent not finite?
-                return self.allowed_funcs[fname](*dargs)  # type: ignore[misc]
-            case _:
-                raise SyntaxError("Unsupported syntax in expression.")
-
-    @staticmethod
-    def _apply_unary(op: ast.unaryop, val: Decimal) -> Decimal:
-        if isinstance(op, ast.UAdd):
-            return val
-        if isinstance(op, ast.USub):
-            return -val
-        raise SyntaxError("Unsupported unary operator.")
-
-    @staticmethod
-    def _apply_binop(a: Decimal, op: ast.operator, b: Decimal) -> Decimal:
-        if isinstance(op, ast.Add):
-            return a + b
-        if isinstance(op, ast.Sub):
-            return a - b
-        if isinstance(op, ast.Mult):
-            return a * b
-        if isinstance(op, ast.Div):
-            if b == 0:
-                raise ZeroDivisionError("Division by zero.")
-            return a / b
-        if isinstance(op, ast.Mod):
-            if b == 0:
-                raise ZeroDivisionError("Modulo by zero.")
-            return a % b
-        if isinstance(op, ast.Pow):
-            # Decimal ** Decimal may be slow for large fractional exponents; still allowed.
-            return a.__pow__(b)
-        raise SyntaxError("Unsupported binary operator.")
+        ctx = self._ctx
+        if ctx.prec != self.settings.precision or ctx.rounding != self.settings.rounding:
+            # settings were mutated in place
+            self._invalidate_ctx()
+            ctx = self._ctx
+        if folded is not None and folded[1] < self._int_limit:
+            return folded[0]
+        for name in consts:  # pi/e/tau: computed on first use at this precision
+            if name not in self.vars:
+                self.vars[name] = _const_at(name, ctx.prec)
+        with localcontext(ctx):
+            if bytecode is not None:
+                try:
+                    return eval(bytecode[0], bytecode[1], self.vars)
+                except NameError as ex:
+                    raise NameError(f"Unknown identifier: {ex.name}") from None
+            return self._run(code)
+
+    # ---- Stack machine ----
+    def _run(self, code: Program) -> Decimal:
+        stack: List[Decimal] = []
+        push, pop = stack.append, stack.pop
+        variables = self.vars
+        for op, arg in code:
+            if op == OP_CONST:
+                push(arg)
+            elif op == OP_VAR:
+                try:
+                    push(variables[arg])
+                except KeyError:
+                    raise NameError(f"Unknown identifier: {arg}") from None
+            elif op == OP_ADD:
+                b = pop()
+                stack[-1] = stack[-1] + b
+            elif op == OP_SUB:
+                b = pop()
+                stack[-1] = stack[-1] - b
+            elif op == OP_MUL:
+                b = pop()
+                stack[-1] = stack[-1] * b
+            elif op == OP_DIV:
+                b = pop()
+                if b == 0:
+                    raise ZeroDivisionError("Division by zero.")
+                stack[-1] = stack[-1] / b
+            elif op == OP_MOD:
+                b = pop()
+                if b == 0:
+                    raise ZeroDivisionError("Modulo by zero.")
+                stack[-1] = stack[-1] % b
+            elif op == OP_POW:
+                # Integral exponents already take libmpdec's exact binary-exponentiation path;
+                # only fractional exponents go through ln/exp (slow, but still allowed).
+                b = pop()
+                stack[-1] = stack[-1] ** b
+            elif op == OP_NEG:
+                stack[-1] = -stack[-1]
+            elif op == OP_CALL1:
+                stack[-1] = arg(stack[-1])
+            elif op == OP_CALL2:
+                b = pop()
+                stack[-1] = arg(stack[-1], b)  # type: ignore[misc]
+        return stack[-1]
 
 def _round_decimal(x: Decimal, ndigits: int) -> Decimal:
-    if ndigits >= 0:
-        q = Decimal(1).scaleb(-ndigits)  # 10**(-ndigits)
-        return x.quantize(q)
-    # Negative ndigits rounds to tens, hundreds, etc.
-    q = Decimal(1).scaleb(-ndigits)  # still works: e.g., ndigits=-1 => q=10
+    # q = 10**(-ndigits); negative ndigits rounds to tens, hundreds, etc. (ndigits=-1 => q=10)
+    q = _ONE.scaleb(-ndigits)
     return x.quantize(q)
 
 # -------- Memory register --------
 
 @dataclass
 class Memory:
-    value: Decimal = Decimal(0)
+    value: Decimal = _ZERO  # Decimals are immutable, so sharing the default is safe
 
     def clear(self) -> None:
-        self.value = Decimal(0)
+        self.value = _ZERO
 
     def recall(self) -> Decimal:
         return self.value
@@ -187,30 +559,88 @@ class Memory:
 
 # -------- Public API --------
 
+# Display symbols typed or pasted into the entry, mapped to engine syntax in one pass (√ is
+# handled separately, since it needs a closing parenthesis)
+_SYMBOL_TRANS = str.maketrans({
+    "÷": "/",
+    "×": "*",
+    "−": "-",  # U+2212 minus sign
+    "^": "**",
+    "π": "pi",
+    "τ": "tau",
+})
+
+# Operand of a prefix root: a number or a name (possibly the start of a call)
+_ROOT_OPERAND = re.compile(r"\s*(?:(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|[A-Za-z_πτ]\w*)")
+
+def _expand_roots(expr: str) -> str:
+    """Rewrite prefix roots as calls: "√4" -> "sqrt(4)", "√abs(x)" -> "sqrt(abs(x))"."""
+    i = expr.rfind("√")
+    while i >= 0:  # right to left, so nested roots ("√√16") expand inside out
+        m = _ROOT_OPERAND.match(expr, i + 1)
+        if m is None:
+            expr = expr[:i] + "sqrt" + expr[i + 1:]  # "√(9)" already reads as a call
+        else:
+            end = m.end()
+            if expr.startswith("(", end):  # a call: take its balanced argument list too
+                depth = 0
+                for k in range(end, len(expr)):
+                    if expr[k] == "(":
+                        depth += 1
+                    elif expr[k] == ")":
+                        depth -= 1
+                        if depth == 0:
+                            end = k + 1
+                            break
+            expr = f"{expr[:i]}sqrt({expr[i + 1:end]}){expr[end:]}"
+        i = expr.rfind("√", 0, i)
+    return expr
+
 class CalculatorEngine:
     """
     Glue between GUI and evaluator. Manages memory and formatting.
     """
 
     def __init__(self, settings: EvalSettings | None = None):
-        self.settings = settings or EvalSettings()
         self.memory = Memory()
+        self.settings = settings or EvalSettings()
+
+    @property
+    def settings(self) -> EvalSettings:
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: EvalSettings) -> None:
+        # One evaluator per settings object; rebuilt only when the settings are replaced
+        self._settings = settings
+        self._evaluator = DecimalEvaluator(settings)
+
+    def set_precision(self, prec: int) -> None:
+        """Set the working precision of this engine (in significant digits)."""
+        if prec < 16:
+            raise ValueError("Precision must be at least 16.")
+        self.settings.precision = prec
+        self._evaluator._invalidate_ctx()
 
     def evaluate(self, expr: str) -> str:
-        expr = expr.strip()
-        if not expr:
+        if not expr or expr.isspace():
             return ""
-        evaluator = DecimalEvaluator(self.settings, variables={"M": self.memory.recall()})
-        result = evaluator.eval(expr)
-        return self.format_decimal(result)
+        return self.format_decimal(self.evaluate_decimal(expr))
+
+    def evaluate_decimal(self, expr: str) -> Decimal:
+        """Evaluate to an unformatted Decimal (memory bound as M), reusing the cached evaluator."""
+        self._evaluator.vars["M"] = self.memory.value
+        return self._evaluator.eval(self.normalize(expr.strip()))
+
+    @staticmethod
+    def normalize(expr: str) -> str:
+        """Translate calculator symbols (÷, ×, ^, π, τ, √) into engine syntax."""
+        if "√" in expr:
+            expr = _expand_roots(expr)
+        return expr.translate(_SYMBOL_TRANS)
 
     @staticmethod
     def format_decimal(x: Decimal) -> str:
-        # Normalize to remove trailing zeros, but keep integer if exact.
-        normalized = x.normalize()
-        # If it's an integer in scientific notation, convert to plain string
-        s = format(normalized, "f") if normalized == normalized.to_integral() else format(normalized, "f")
-        # Strip trailing zeros after decimal point
-        if "." in s:
-            s = s.rstrip("0").rstrip(".")
-        return s or "0"
+        # normalize() already drops trailing zeros (1.2300 -> 1.23, 10.00 -> 1E+1), and the
+        # fixed-point format expands any positive exponent, so nothing is left to strip.
+        return format(x.normalize(), "f")
@@ -27,6 +27,7 @@ Notes:
 from __future__ import annotations
 
 import tkinter as tk
+from decimal import Decimal, InvalidOperation
 from tkinter import ttk, messagebox
 from typing import Callable
 
@@ -54,6 +55,23 @@ SYMBOL_MAP = {
     "^": "**",
 }
 
+# Keypad actions; every key resolves to one (action, payload) pair via KEY_ACTIONS
+ACT_INSERT = 0
+ACT_EVAL = 1
+ACT_CLEAR = 2
+ACT_BACKSPACE = 3
+ACT_TOGGLE_SIGN = 4
+ACT_MEMORY = 5
+
+KEY_ACTIONS: dict[str, tuple[int, str]] = {k: (ACT_INSERT, v) for k, v in SYMBOL_MAP.items()}
+KEY_ACTIONS.update({
+    "=": (ACT_EVAL, ""),
+    "C": (ACT_CLEAR, ""),
+    "⌫": (ACT_BACKSPACE, ""),
+    "±": (ACT_TOGGLE_SIGN, ""),
+})
+KEY_ACTIONS.update({k: (ACT_MEMORY, k) for k in ("MC", "MR", "M+", "M-")})
+
 class CalculatorApp(ttk.Frame):
     def __init__(self, master: tk.Misc | None = None):
         super().__init__(master)
@@ -112,10 +130,10 @@ class CalculatorApp(ttk.Frame):
         ttk.Button(precision_frame, text="Apply", command=self.apply_precision).pack(side="left")
 
         # Keyboard bindings
-        master.bind("<Return>", lambda e: self.on_key("="))
-        master.bind("<KP_Enter>", lambda e: self.on_key("="))
-        master.bind("<BackSpace>", lambda e: self.on_key("⌫"))
-        master.bind("<Escape>", lambda e: self.on_key("C"))
+        master.bind("<Return>", self._on_return_key)
+        master.bind("<KP_Enter>", self._on_return_key)
+        master.bind("<BackSpace>", self._on_backspace_key)
+        master.bind("<Escape>", self._on_escape_key)
         master.bind("<Key>", self._on_text_key)
 
     def _insert(self, s: str) -> None:
@@ -123,29 +141,37 @@ class CalculatorApp(ttk.Frame):
         self.entry.insert(pos, s)
 
     def on_key(self, key: str) -> None:
-        if key in SYMBOL_MAP:
-            self._insert(SYMBOL_MAP[key])
-        elif key == "=":
+        action, payload = KEY_ACTIONS.get(key, (ACT_INSERT, key))
+        if action == ACT_INSERT:
+            self._insert(payload)
+        elif action == ACT_EVAL:
             expr = self.display_var.get()
             try:
                 out = self.engine.evaluate(expr)
                 self.result_var.set(out)
             except Exception as ex:
                 messagebox.showerror("Error", str(ex))
-        elif key == "C":
+        elif action == ACT_CLEAR:
             self.display_var.set("")
             self.result_var.set("")
-        elif key == "⌫":
+        elif action == ACT_BACKSPACE:
             current = self.display_var.get()
             if current:
                 self.display_var.set(current[:-1])
-        elif key == "±":
+        elif action == ACT_TOGGLE_SIGN:
             # Toggle sign of last number segment
             self._toggle_sign()
-        elif key in {"MC", "MR", "M+", "M-"}:
-            self._handle_memory(key)
-        else:
-            self._insert(key)
+        elif action == ACT_MEMORY:
+            self._handle_memory(payload)
+
+    def _on_return_key(self, event: tk.Event) -> None:
+        self.on_key("=")
+
+    def _on_backspace_key(self, event: tk.Event) -> None:
+        self.on_key("⌫")
+
+    def _on_escape_key(self, event: tk.Event) -> None:
+        self.on_key("C")
 
     def _toggle_sign(self) -> None:
         text = self.display_var.get()
@@ -167,8 +193,6 @@ class CalculatorApp(ttk.Frame):
         self.display_var.set(new)
 
     def _handle_memory(self, key: str) -> None:
-        from .core import Decimal
-
         if key == "MC":
             self.engine.memory.clear()
             self.result_var.set("0")
@@ -182,21 +206,25 @@ class CalculatorApp(ttk.Frame):
             val = self._current_or_result_decimal()
             self.engine.memory.sub(val)
 
-    def _current_or_result_decimal(self):
-        from .core import Decimal, DecimalEvaluator, EvalSettings
-
+    def _current_or_result_decimal(self) -> Decimal:
         # Prefer evaluated result if present; else try to evaluate current input
         if self.result_var.get():
-            from decimal import Decimal as _D
-            return _D(self.result_var.get())
+            return Decimal(self.result_var.get())
         expr = self.display_var.get() or "0"
-        evaluator = DecimalEvaluator(EvalSettings(), {})
-        return evaluator.eval(expr)
+        try:
+            value = Decimal(expr)  # plain numbers (the common M+/M- case) skip parsing
+        except InvalidOperation:
+            pass
+        else:
+            if value.is_finite():  # "nan"/"inf" are not engine syntax; let the engine reject them
+                return value
+        return self.engine.evaluate_decimal(expr)
 
     def apply_precision(self) -> None:
         try:
             p = int(self.prec_var.get())
             set_precision(p)
+            self.engine.set_precision(p)
             self.result_var.set(f"Precision set to {p}")
         except Exception as ex:
             messagebox.showerror("Precision Error", str(ex))
@@ -25,12 +25,13 @@ Notes:
 
 from __future__ import annotations
 
-import tkinter as tk
 
-from .gui import CalculatorApp
+def main() -> None:
+    # Imported here so that importing the package (e.g. for the headless engine) never loads Tk
+    import tkinter as tk
 
+    from .gui import CalculatorApp
 
-def main() -> None:
     root = tk.Tk()
     app = CalculatorApp(root)
     app.mainloop()
@@ -1,7 +1,7 @@
-from decimal import Decimal
+from decimal import Context, Decimal, InvalidOperation, getcontext, localcontext
 import pytest
 
-from pycalc_tk.core import CalculatorEngine, EvalSettings, set_precision
+from pycalc_tk.core import CalculatorEngine, EvalSettings, _const_at, set_precision
 
 
 def evals(expr: str, prec: int = 100) -> Decimal:
@@ -18,7 +18,6 @@ def evals(expr: str, prec: int = 100) -> Decimal:
         ("5%2", Decimal("1")),
         ("2^10", Decimal("1024")),
         ("sqrt(4)", Decimal("2")),
-        ("ln(e)", Decimal("1")),
         ("log10(1000)", Decimal("3")),
         ("exp(0)", Decimal("0").exp()),  # 1
         ("abs(-12.5)", Decimal("12.5")),
@@ -30,6 +29,45 @@ def test_basic(expr, expected):
     assert out == expected
 
 
+def test_ln_of_e():
+    # e is correctly rounded to 100 digits, so ln(e) is 1 to within a couple of ulps
+    assert abs(evals("ln(e)") - 1) < Decimal("1e-98")
+
+
+def test_constants_above_global_precision():
+    # the constants must be computed in their own guarded context, not the global one
+    saved = getcontext().prec
+    set_precision(16)
+    try:
+        tau = CalculatorEngine(EvalSettings(precision=120)).evaluate_decimal("tau")
+    finally:
+        set_precision(saved)
+    ref = CalculatorEngine(EvalSettings(precision=200)).evaluate_decimal("tau")
+    assert tau == Context(prec=120).plus(ref)
+
+
+def test_constants_are_computed_lazily():
+    eng = CalculatorEngine(EvalSettings(precision=50))
+    misses = _const_at.cache_info().misses
+    eng.set_precision(100_000)  # must not compute pi/e/tau at 100k digits
+    assert eng.evaluate("1+1") == "2"
+    assert eng.evaluate("1/4") == "0.25"
+    assert _const_at.cache_info().misses == misses
+    eng.set_precision(60)
+    assert eng.evaluate("pi") == "3.14159265358979323846264338327950288419716939937510582097494"
+
+
+def test_normalize_symbols():
+    assert CalculatorEngine.normalize("2×3÷4−1") == "2*3/4-1"
+    assert CalculatorEngine.normalize("√(2)^2+π*τ") == "sqrt(2)**2+pi*tau"
+    assert evals("√(9)×2^3") == Decimal("24")
+    assert CalculatorEngine.normalize("√4+√2.25*√π") == "sqrt(4)+sqrt(2.25)*sqrt(pi)"
+    assert evals("√4") == Decimal("2")
+    assert evals("√(9)") == Decimal("3")
+    assert evals("√16^2") == Decimal("16")  # the root binds to its operand only
+    assert evals("√√16+√abs(-4)") == Decimal("4")
+
+
 def test_precision_high():
     set_precision(200)
     a = evals("1/7", 200)
@@ -38,6 +76,101 @@ def test_precision_high():
     assert a == b
 
 
+def test_integer_expressions_match_decimal():
+    eng = CalculatorEngine(EvalSettings(precision=16))
+    # wider than the precision: must round exactly like Decimal arithmetic
+    with localcontext(Context(prec=16)):
+        expected = (Decimal(10**20) + 1) * (Decimal(10**20) - 1)
+    assert Decimal(eng.evaluate("(10**20+1)*(10**20-1)")) == expected
+    assert CalculatorEngine(EvalSettings(precision=50)).evaluate("(10**20+1)*(10**20-1)") == str(10**40 - 1)
+    assert eng.evaluate("-7%3") == "-1"  # sign of the dividend, as in Decimal
+    assert eng.evaluate("0*-1") == "-0"
+    assert eng.evaluate("7/2") == "3.5"
+
+
+def test_engine_set_precision():
+    eng = CalculatorEngine(EvalSettings(precision=20))
+    assert eng.evaluate("1/3") == "0." + "3" * 20
+    eng.set_precision(30)
+    assert eng.evaluate("1/3") == "0." + "3" * 30
+    assert eng.evaluate("pi") == "3.14159265358979323846264338328"
+    with pytest.raises(ValueError):
+        eng.set_precision(8)
+
+
+def test_integer_power_is_exact():
+    # 3**100 has 48 digits: it must come back exact, not via ln/exp rounding
+    assert evals("3**100") == Decimal(3**100)
+    assert evals("pow(2, -3)") == Decimal("0.125")
+
+
+@pytest.mark.parametrize("expr, fn", [
+    ("sqrt(2)", lambda: Decimal(2).sqrt()),
+    ("ln(3)", lambda: Decimal(3).ln()),
+    ("log10(7)", lambda: Decimal(7).log10()),
+    ("exp(2)", lambda: Decimal(2).exp()),
+])
+def test_functions_high_precision(expr, fn):
+    # Above the MPFR threshold (when gmpy2 is installed) results must match decimal exactly
+    with localcontext(Context(prec=200)):
+        expected = fn()
+    assert evals(expr, 200) == expected
+
+
+@pytest.mark.parametrize("expr, expected", [
+    ("sqrt(4)", "2"),
+    ("sqrt(2.25)", "1.5"),
+    ("sqrt(1E+4)", "1E+2"),
+    ("log10(1000)", "3"),
+    ("log10(100.0)", "2"),
+    ("ln(1)", "0"),
+    ("exp(0)", "1"),
+])
+def test_exact_functions_high_precision(expr, expected):
+    # exact results keep decimal's ideal exponent, not 200 digits of trailing zeros
+    out = CalculatorEngine(EvalSettings(precision=200)).evaluate_decimal(expr)
+    assert str(out) == expected
+
+
+def test_function_domain_errors_high_precision():
+    with pytest.raises(InvalidOperation):
+        evals("sqrt(-1)", 200)
+    with pytest.raises(InvalidOperation):
+        evals("ln(-1)", 200)
+
+
+def test_max_depth_per_engine():
+    expr = "+".join(["1"] * 10)  # left-nested: depth 9
+    shallow = CalculatorEngine(EvalSettings(precision=50, max_depth=4))
+    deep = CalculatorEngine(EvalSettings(precision=50, max_depth=64))
+    with pytest.raises(ValueError):
+        shallow.evaluate(expr)
+    assert deep.evaluate(expr) == "10"
+
+
+def test_errors_without_function_calls():
+    # call-free expressions take the bytecode path; errors must match the stack machine
+    eng = CalculatorEngine(EvalSettings(precision=50))
+    with pytest.raises(ZeroDivisionError, match="Division by zero"):
+        eng.evaluate("pi/(e-e)")
+    with pytest.raises(ZeroDivisionError, match="Modulo by zero"):
+        eng.evaluate("1.5%0")
+    with pytest.raises(NameError, match="Unknown identifier: x"):
+        eng.evaluate("2*x+1")
+    with pytest.raises(NameError, match="Unknown identifier: abs"):
+        eng.evaluate("abs+1")  # functions are not visible as names
+    for expr in ("__builtins__", "__builtins__+1"):
+        with pytest.raises(NameError, match="Unknown identifier: __builtins__"):
+            eng.evaluate(expr)
+
+
+def test_surrounding_whitespace():
+    eng = CalculatorEngine(EvalSettings(precision=50))
+    assert eng.evaluate("  ") == ""
+    assert eng.evaluate(" 1+2 ") == "3"
+    assert eng.evaluate_decimal(" 1+2\t") == Decimal(3)  # M+/M- use this entry point
+
+
 def test_memory_variable():
     eng = CalculatorEngine()
     # store 3 in memory via evaluate/variables path